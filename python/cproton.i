@@ -404,6 +404,26 @@ int pn_ssl_get_cert_fingerprint(pn_ssl_t *ssl, char *OUTPUT, size_t MAX_OUTPUT_S
     }
   }
 
+  /* Returns (attrs, created) where created is True if attrs was only now made and stored */
+  PyObject *pn_record_get_or_create_pyctx(pn_record_t *record, pn_handle_t key) {
+    PyObject *result = NULL;
+    PyObject *attrs = (PyObject *)pn_record_get(record, key);
+    SWIG_PYTHON_THREAD_BEGIN_BLOCK;
+    if (attrs) {
+      result = Py_BuildValue("(OO)", attrs, Py_False);
+    } else {
+      attrs = PyDict_New();
+      if (attrs) {
+        pn_record_def(record, key, PN_PYREF);
+        pn_record_set(record, key, attrs);
+        /* The record holds its own reference now, hand ours to the tuple */
+        result = Py_BuildValue("(NO)", attrs, Py_True);
+      }
+    }
+    SWIG_PYTHON_THREAD_END_BLOCK;
+    return result;
+  }
+
 %}
 
 %include "proton/cproton.i"
@@ -18,6 +18,7 @@
 # under the License.
 #
 
+import optparse
 import uuid
 from proton import Message
 from proton.handlers import MessagingHandler
@@ -58,7 +59,12 @@ class Server(MessagingHandler):
                             correlation_id=event.message.correlation_id))
 
 
+parser = optparse.OptionParser(usage="usage: %prog [options]")
+parser.add_option("-a", "--address", default="0.0.0.0:8888",
+                  help="address on which to listen for requests (default %default)")
+opts, args = parser.parse_args()
+
 try:
-    Container(Server("0.0.0.0:8888")).run()
+    Container(Server(opts.address)).run()
 except KeyboardInterrupt:
     pass
@@ -17,35 +17,91 @@
 # under the License.
 #
 
+import errno
 import re
+import socket
 import subprocess
+import sys
 import time
 import unittest
 
+# Use large pipes where the platform lets us size them
+if sys.version_info >= (3, 10) and sys.platform == 'linux':
+    PIPE_OPTIONS = {'pipesize': 1 << 20}
+else:
+    PIPE_OPTIONS = {}
+
+# Expected output of the simple/direct/tx receivers, shared by several tests
+SEQUENCE_OUTPUT = ["{'sequence': %i}" % (i + 1,) for i in range(100)]
+
+# Messages fed to db_ctrl.py, built once so they go to its stdin in a single write
+DB_MESSAGES = "".join("Message-%i\n" % (i + 1) for i in range(100)).encode('utf-8')
+
 
 class Popen(subprocess.Popen):
 
-    # We always use these options
+    # We always use these options, stderr is kept apart from stdout unless
+    # the caller says otherwise
     def __init__(self, args, **kwargs):
+        options = dict(PIPE_OPTIONS, stderr=subprocess.PIPE)
+        options.update(kwargs)
         super(Popen, self).\
             __init__(args,
                      shell=False,
-                     stderr=subprocess.STDOUT,
-                     stdout=subprocess.PIPE,
-                     universal_newlines=True, **kwargs)
+                     bufsize=-1,
+                     stdout=subprocess.PIPE, **options)
+
+
+# Decode a process's output and split it into stripped lines, passing on
+# anything the process wrote to stderr
+def output_lines(out, err):
+    if err:
+        sys.stderr.write(err.decode('utf-8'))
+    return [l.strip() for l in out.decode('utf-8').splitlines()]
+
+
+# Run a command to completion and return its output as stripped lines,
+# communicate() reads stdout and stderr together so the command can never
+# stall on a full pipe
+def run_lines(args):
+    with Popen(args) as p:
+        return output_lines(*p.communicate())
+
+
+# Run commands concurrently and return the output lines of each
+def run_all(*commands):
+    processes = [Popen(args) for args in commands]
+    return [output_lines(*p.communicate()) for p in processes]
 
 
-# Like subprocess.run with our defaults but returning the Popen object
-def run(args, **kwargs):
-    p = Popen(args, **kwargs)
-    p.wait()
-    return p
+# Wait until something is listening on host:port.
+# Probe by binding rather than connecting: a connection that goes away
+# without speaking AMQP makes the example log an error into its output.
+def wait_listen(host, port, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket() as s:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, True)
+            try:
+                s.bind((host, port))
+            except OSError as e:
+                if e.errno == errno.EADDRINUSE:
+                    return
+                raise
+        time.sleep(0.005)
+    raise TimeoutError("nothing listening on %s:%i" % (host, port))
+
+
+# Pick a free port for an example to listen on, so tests don't contend for a fixed one
+def free_port():
+    with socket.socket() as s:
+        s.bind(('localhost', 0))
+        return s.getsockname()[1]
+
 
 class ExamplesTest(unittest.TestCase):
     def test_helloworld(self, example="helloworld.py"):
-        with run([example]) as p:
-            output = [l.strip() for l in p.stdout]
-            self.assertEqual(output, ['Hello World!'])
+        self.assertEqual(run_lines([example]), ['Hello World!'])
 
     def test_helloworld_direct(self):
         self.test_helloworld('helloworld_direct.py')
@@ -60,25 +116,20 @@ class ExamplesTest(unittest.TestCase):
         self.test_helloworld('helloworld_direct_tornado.py')
 
     def test_simple_send_recv(self, recv='simple_recv.py', send='simple_send.py'):
-        with Popen([recv]) as r:
-            with run([send]):
-                pass
-            actual = [l.strip() for l in r.stdout]
-            expected = ["{'sequence': %i}" % (i + 1,) for i in range(100)]
+        actual, _ = run_all([recv], [send])
+        self.assertEqual(actual, SEQUENCE_OUTPUT)
+
+    def test_client_server(self, client=['client.py'], server=['server.py'], listen=None):
+        with Popen(server, stderr=subprocess.DEVNULL) as s:
+            if listen:
+                wait_listen(*listen)
+            actual = run_lines(client)
+            inputs = ["Twas brillig, and the slithy toves",
+                      "Did gire and gymble in the wabe.",
+                      "All mimsy were the borogroves,",
+                      "And the mome raths outgrabe."]
+            expected = ["%s => %s" % (l, l.upper()) for l in inputs]
             self.assertEqual(actual, expected)
-
-    def test_client_server(self, client=['client.py'], server=['server.py'], sleep=0):
-        with Popen(server) as s:
-            if sleep:
-                time.sleep(sleep)
-            with run(client) as c:
-                actual = [l.strip() for l in c.stdout]
-                inputs = ["Twas brillig, and the slithy toves",
-                          "Did gire and gymble in the wabe.",
-                          "All mimsy were the borogroves,",
-                          "And the mome raths outgrabe."]
-                expected = ["%s => %s" % (l, l.upper()) for l in inputs]
-                self.assertEqual(actual, expected)
             s.terminate()
 
     def test_sync_client_server(self):
@@ -90,13 +141,14 @@ class ExamplesTest(unittest.TestCase):
     def test_sync_client_server_tx(self):
         self.test_client_server(client=['sync_client.py'], server=['server_tx.py'])
 
-    def test_client_server_direct(self):
-        self.test_client_server(client=['client.py', '-a', 'localhost:8888/examples'],
-                                server=['server_direct.py'], sleep=0.5)
+    def test_client_server_direct(self, client='client.py'):
+        port = free_port()
+        self.test_client_server(client=[client, '-a', 'localhost:%i/examples' % port],
+                                server=['server_direct.py', '-a', 'localhost:%i' % port],
+                                listen=('localhost', port))
 
     def test_sync_client_server_direct(self):
-        self.test_client_server(client=['sync_client.py', '-a', 'localhost:8888/examples'],
-                                server=['server_direct.py'], sleep=0.5)
+        self.test_client_server_direct(client='sync_client.py')
 
     def test_db_send_recv(self):
         self.maxDiff = None
@@ -104,58 +156,47 @@ class ExamplesTest(unittest.TestCase):
         subprocess.check_call(['db_ctrl.py', 'init', './src_db'])
         subprocess.check_call(['db_ctrl.py', 'init', './dst_db'])
         with Popen(['db_ctrl.py', 'insert', './src_db'], stdin=subprocess.PIPE) as fill:
-            for i in range(100):
-                fill.stdin.write("Message-%i\n" % (i + 1))
-            fill.stdin.close()
+            fill.communicate(DB_MESSAGES)
 
         # run send and recv
-        with Popen(['db_recv.py', '-m', '100']) as r:
-            with run(['db_send.py', '-m', '100']):
-                pass
-            r.wait()
-            # verify output of receive
-            actual = [l.strip() for l in r.stdout]
-            expected = ["inserted message %i" % (i + 1) for i in range(100)]
-            self.assertEqual(actual, expected)
+        actual, _ = run_all(['db_recv.py', '-m', '100'], ['db_send.py', '-m', '100'])
+        # verify output of receive
+        expected = ["inserted message %i" % (i + 1) for i in range(100)]
+        self.assertEqual(actual, expected)
 
         # verify state of databases
-        with run(['db_ctrl.py', 'list', './dst_db']) as v:
-            expected = ["(%i, 'Message-%i')" % (i + 1, i + 1) for i in range(100)]
-            actual = [l.strip() for l in v.stdout]
-            self.assertEqual(actual, expected)
+        actual = run_lines(['db_ctrl.py', 'list', './dst_db'])
+        expected = ["(%i, 'Message-%i')" % (i + 1, i + 1) for i in range(100)]
+        self.assertEqual(actual, expected)
 
     def test_tx_send_tx_recv(self):
         self.test_simple_send_recv(recv='tx_recv.py', send='tx_send.py')
 
     def test_simple_send_direct_recv(self):
         self.maxDiff = None
-        with Popen(['direct_recv.py', '-a', 'localhost:8888']) as r:
-            time.sleep(0.5)
-            with run(['simple_send.py', '-a', 'localhost:8888']):
-                pass
-            r.wait()
-            actual = [l.strip() for l in r.stdout]
-            expected = ["{'sequence': %i}" % (i + 1,) for i in range(100)]
-            self.assertEqual(actual, expected)
+        port = free_port()
+        address = 'localhost:%i' % port
+        with Popen(['direct_recv.py', '-a', address]) as r:
+            wait_listen('localhost', port)
+            run_lines(['simple_send.py', '-a', address])
+            actual = output_lines(*r.communicate())
+            self.assertEqual(actual, SEQUENCE_OUTPUT)
 
     def test_direct_send_simple_recv(self):
-        with Popen(['direct_send.py', '-a', 'localhost:8888']):
-            time.sleep(0.5)
-            with run(['simple_recv.py', '-a', 'localhost:8888']) as r:
-                actual = [l.strip() for l in r.stdout]
-                expected = ["{'sequence': %i}" % (i + 1,) for i in range(100)]
-                self.assertEqual(actual, expected)
+        port = free_port()
+        address = 'localhost:%i' % port
+        with Popen(['direct_send.py', '-a', address], stderr=subprocess.DEVNULL):
+            wait_listen('localhost', port)
+            actual = run_lines(['simple_recv.py', '-a', address])
+            self.assertEqual(actual, SEQUENCE_OUTPUT)
 
     def test_selected_recv(self):
-        with run(['colour_send.py']):
-            pass
+        run_lines(['colour_send.py'])
 
-        with run(['selected_recv.py', '-m', '50']) as r:
-            actual = [l.strip() for l in r.stdout]
-            expected = ["green %i" % (i + 1) for i in range(100) if i % 2 == 0]
-            self.assertEqual(actual, expected)
+        actual = run_lines(['selected_recv.py', '-m', '50'])
+        expected = ["green %i" % (i + 1) for i in range(100) if i % 2 == 0]
+        self.assertEqual(actual, expected)
 
-        with run(['simple_recv.py', '-m', '50']) as r:
-            actual = [l.strip() for l in r.stdout]
-            expected = ["red %i" % (i + 1) for i in range(100) if i % 2 == 1]
-            self.assertEqual(actual, expected)
+        actual = run_lines(['simple_recv.py', '-m', '50'])
+        expected = ["red %i" % (i + 1) for i in range(100) if i % 2 == 1]
+        self.assertEqual(actual, expected)
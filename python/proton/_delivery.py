@@ -310,7 +310,7 @@ class Delivery(Wrapper):
         if impl is None:
             return None
         else:
-            return Delivery(impl)
+            return Delivery._wrap(impl, pn_delivery_attachments)
 
     def __init__(self, impl):
         Wrapper.__init__(self, impl, pn_delivery_attachments)
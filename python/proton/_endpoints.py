@@ -62,7 +62,7 @@ from ._data import Data, dat2obj, obj2dat, PropertyDict, SymbolList
 from ._delivery import Delivery
 from ._exceptions import ConnectionException, EXCEPTIONS, LinkException, SessionException
 from ._transport import Transport
-from ._wrapper import Wrapper
+from ._wrapper import Wrapper, wrapper_attrs
 from typing import Callable, Dict, List, Optional, Union, TYPE_CHECKING
 if TYPE_CHECKING:
     from ._condition import Condition
@@ -153,6 +153,7 @@ class Endpoint(object):
             self._handler.add(handler)
 
 
+@wrapper_attrs("_handler", "_acceptor")
 class Connection(Wrapper, Endpoint):
     """
     A representation of an AMQP connection.
@@ -163,7 +164,7 @@ class Connection(Wrapper, Endpoint):
         if impl is None:
             return None
         else:
-            return Connection(impl)
+            return Connection._wrap(impl, pn_connection_attachments)
 
     def __init__(self, impl=pn_connection):
         Wrapper.__init__(self, impl, pn_connection_attachments)
@@ -588,6 +589,7 @@ class Connection(Wrapper, Endpoint):
     """)
 
 
+@wrapper_attrs("_handler")
 class Session(Wrapper, Endpoint):
     """A container of links"""
     @staticmethod
@@ -595,7 +597,7 @@ class Session(Wrapper, Endpoint):
         if impl is None:
             return None
         else:
-            return Session(impl)
+            return Session._wrap(impl, pn_session_attachments)
 
     def __init__(self, impl):
         Wrapper.__init__(self, impl, pn_session_attachments)
@@ -743,6 +745,7 @@ class Session(Wrapper, Endpoint):
         pn_session_free(self._impl)
 
 
+@wrapper_attrs("_handler", "_properties_dict")
 class Link(Wrapper, Endpoint):
     """
     A representation of an AMQP link (a unidirectional channel for
@@ -767,9 +770,9 @@ class Link(Wrapper, Endpoint):
         if impl is None:
             return None
         if pn_link_is_sender(impl):
-            return Sender(impl)
+            return Sender._wrap(impl, pn_link_attachments)
         else:
-            return Receiver(impl)
+            return Receiver._wrap(impl, pn_link_attachments)
 
     def __init__(self, impl):
         Wrapper.__init__(self, impl, pn_link_attachments)
@@ -1071,6 +1071,29 @@ CFlowController = FlowController
 CHandshaker = Handshaker
 
 
+def _push_io_events(reactor, readable, writable):
+    """
+    Raise the readable and writable events for one I/O wakeup. Selectables
+    using the default :meth:`Selectable.readable`/:meth:`Selectable.writable`
+    have their events pushed as a batch; those overriding them still get
+    their method called, in order, after the events batched before them.
+    """
+    batch = []
+    for selectables, method, etype in ((readable, 'readable', Event.SELECTABLE_READABLE),
+                                       (writable, 'writable', Event.SELECTABLE_WRITABLE)):
+        default = getattr(Selectable, method)
+        for s in selectables:
+            if getattr(type(s), method) is default:
+                batch.append((s, etype))
+            else:
+                if batch:
+                    reactor.push_events(batch)
+                    batch = []
+                getattr(s, method)()
+    if batch:
+        reactor.push_events(batch)
+
+
 class PythonIO:
 
     def __init__(self) -> None:
@@ -1124,10 +1147,7 @@ class PythonIO:
 
         now = reactor.mark()
 
-        for s in readable:
-            s.readable()
-        for s in writable:
-            s.writable()
+        _push_io_events(reactor, readable, writable)
         for s in self.selectables:
             if s.deadline and now > s.deadline:
                 s.expired()
@@ -1167,10 +1187,7 @@ class IOHandler(Handler):
 
         now = r.mark()
 
-        for s in readable:
-            s.readable()
-        for s in writable:
-            s.writable()
+        _push_io_events(r, readable, writable)
         for s in expired:
             s.expired()
 
@@ -110,7 +110,7 @@ class TimerSelectable(Selectable):
 
     def expired(self) -> None:
         self._reactor.timer_tick()
-        self.deadline = self._reactor.timer_deadline
+        self.deadline = self._reactor.timer_deadline or 0
         self.update()
 
 
@@ -208,7 +208,7 @@ class Reactor(object):
     def start(self) -> None:
         self.push_event(self, Event.REACTOR_INIT)
         self._selectable = TimerSelectable(self)
-        self._selectable.deadline = self.timer_deadline
+        self._selectable.deadline = self.timer_deadline or 0
         # TODO set up fd to read for wakeups - but problematic on windows
         #  self._selectable.fileno(self._wakeup[0])
         #  self._selectable.reading = True
@@ -390,6 +390,11 @@ class Reactor(object):
     def push_event(self, obj, etype):
         self._collector.put(obj, etype)
 
+    def push_events(self, events):
+        put = self._collector.put
+        for obj, etype in events:
+            put(obj, etype)
+
 
 class EventInjector(object):
     """
@@ -28,21 +28,37 @@ if TYPE_CHECKING:
     from socket import socket
 
 
+# Lifecycle flags, packed into Selectable._flags. reading and writing are
+# checked on every wakeup so they stay plain slots.
+_TERMINAL = 1
+_RELEASED = 2
+_TERMINATED = 4
+
+
 class Selectable(object):
 
+    __slots__ = ["_delegate", "_reactor", "_push", "reading", "writing", "deadline", "_flags", "__dict__"]
+
     def __init__(self, delegate, reactor):
         self._delegate = delegate
         self.reading = False
         self.writing = False
-        self._deadline = 0
-        self._terminal = False
-        self._released = False
-        self._terminated = False
+        self._flags = 0
+        # Absolute time at which the selectable expires, 0 if it has no deadline
+        self.deadline = 0
         self._reactor = reactor
-        self.push_event(self, Event.SELECTABLE_INIT)
+        # Bound once here as events are raised many times over a selectable's life
+        self._push = reactor.push_event
+        if delegate is not None:
+            # Bind the delegate's I/O methods directly on the instance so the
+            # reactor's per event calls don't have to fall through __getattr__
+            for name in ('fileno', 'send', 'recv'):
+                if hasattr(delegate, name):
+                    setattr(self, name, getattr(delegate, name))
+        self._push(self, Event.SELECTABLE_INIT)
 
     def close(self) -> None:
-        if self._delegate and not self._released:
+        if self._delegate and not self._flags & _RELEASED:
             self._delegate.close()
 
     def fileno(self) -> int:
@@ -54,47 +70,33 @@ class Selectable(object):
     def __getattr__(self, name):
         return getattr(self._delegate, name)
 
-    def _get_deadline(self):
-        tstamp = self._deadline
-        if tstamp:
-            return tstamp
-        else:
-            return None
-
-    def _set_deadline(self, deadline):
-        if not deadline:
-            self._deadline = 0
-        else:
-            self._deadline = deadline
-
-    deadline = property(_get_deadline, _set_deadline)
-
     def push_event(self, context, etype):
-        self._reactor.push_event(context, etype)
+        self._push(context, etype)
 
     def update(self) -> None:
-        if not self._terminated:
-            if self._terminal:
-                self._terminated = True
-                self.push_event(self, Event.SELECTABLE_FINAL)
+        flags = self._flags
+        if not flags & _TERMINATED:
+            if flags & _TERMINAL:
+                self._flags = flags | _TERMINATED
+                self._push(self, Event.SELECTABLE_FINAL)
             else:
-                self.push_event(self, Event.SELECTABLE_UPDATED)
+                self._push(self, Event.SELECTABLE_UPDATED)
 
     def readable(self) -> None:
-        self.push_event(self, Event.SELECTABLE_READABLE)
+        self._push(self, Event.SELECTABLE_READABLE)
 
     def writable(self) -> None:
-        self.push_event(self, Event.SELECTABLE_WRITABLE)
+        self._push(self, Event.SELECTABLE_WRITABLE)
 
     def expired(self) -> None:
-        self.push_event(self, Event.SELECTABLE_EXPIRED)
+        self._push(self, Event.SELECTABLE_EXPIRED)
 
     @property
     def is_terminal(self) -> bool:
-        return self._terminal
+        return bool(self._flags & _TERMINAL)
 
     def terminate(self) -> None:
-        self._terminal = True
+        self._flags |= _TERMINAL
 
     def release(self) -> None:
-        self._released = True
+        self._flags |= _RELEASED
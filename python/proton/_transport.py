@@ -43,7 +43,7 @@ from cproton import PN_EOS, PN_OK, PN_SASL_AUTH, PN_SASL_NONE, PN_SASL_OK, PN_SA
 from ._common import millis2secs, secs2millis, unicode2utf8, utf82unicode
 from ._condition import cond2obj, obj2cond
 from ._exceptions import EXCEPTIONS, SSLException, SSLUnavailable, SessionException, TransportException
-from ._wrapper import Wrapper
+from ._wrapper import Wrapper, wrapper_attrs
 
 from typing import Callable, Optional, Type, Union, TYPE_CHECKING, List
 
@@ -61,6 +61,7 @@ class TraceAdapter:
         self.tracer(Transport.wrap(trans_impl), message)
 
 
+@wrapper_attrs("_sasl", "_ssl", "_reactor", "_connect_selectable")
 class Transport(Wrapper):
     """
     A network channel supporting an AMQP connection.
@@ -89,7 +90,7 @@ class Transport(Wrapper):
         if impl is None:
             return None
         else:
-            return Transport(_impl=impl)
+            return Transport._wrap(impl, pn_transport_attachments)
 
     def __init__(self, mode=None, _impl=pn_transport):
         Wrapper.__init__(self, _impl, pn_transport_attachments)
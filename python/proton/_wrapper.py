@@ -18,9 +18,9 @@
 #
 
 from cproton import pn_incref, pn_decref, \
-    pn_py2void, pn_void2py, \
-    pn_record_get, pn_record_def, pn_record_set, \
-    PN_PYREF
+    pn_py2void, pn_record_get_or_create_pyctx
+
+from weakref import WeakValueDictionary
 
 from ._exceptions import ProtonException
 
@@ -45,11 +45,51 @@ class EmptyAttrs:
 EMPTY_ATTRS = EmptyAttrs()
 
 
+def _attrs_property(name: str) -> property:
+    def fget(self):
+        try:
+            return self._attrs[name]
+        except KeyError:
+            raise AttributeError(name + " not in _attrs") from None
+
+    def fset(self, value):
+        self._attrs[name] = value
+
+    def fdel(self):
+        del self._attrs[name]
+
+    return property(fget, fset, fdel)
+
+
+def wrapper_attrs(*names: str) -> Callable[[type], type]:
+    """ Class decorator declaring the well known attributes a Wrapper subclass keeps in its _attrs.
+        Each name gets a property that goes straight to _attrs, so accessing it needs neither the
+        __getattr__ fallback nor the class attribute check in __setattr__.
+        Only private (underscore prefixed) names may be declared, the properties carry no
+        documentation and must not show up in the public API.
+    """
+    def decorate(cls: type) -> type:
+        for name in names:
+            if not name.startswith('_'):
+                raise ValueError("wrapper_attrs only declares private attributes, not %r" % name)
+            setattr(cls, name, _attrs_property(name))
+        cls._class_attrs = cls._class_attrs | frozenset(names)
+        return cls
+    return decorate
+
+
+# Live wrappers of existing C objects keyed by (class, address), see Wrapper._wrap
+_wrappers = WeakValueDictionary()
+
+addressof = int
+
+
 class Wrapper(object):
     """ Wrapper for python objects that need to be stored in event contexts and be retrived again from them
         Quick note on how this works:
-        The actual *python* object has only 3 attributes which redirect into the wrapped C objects:
+        The actual *python* object has only 4 attributes (held in slots) which redirect into the wrapped C objects:
         _impl   The wrapped C object itself
+        _addr   The address of the wrapped C object, used for hashing and comparison
         _attrs  This is a special pn_record_t holding a PYCTX which is a python dict
                 every attribute in the python object is actually looked up here
         _record This is the C record itself (so actually identical to _attrs really but
@@ -62,15 +102,42 @@ class Wrapper(object):
 
     """
 
+    __slots__ = ["_impl", "_addr", "_attrs", "_record", "__weakref__"]
+
+    _repr_prefix = "<proton._wrapper.Wrapper "
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._repr_prefix = f"<{cls.__module__}.{cls.__name__} "
+        # Names that __setattr__ must set on the object itself rather than in _attrs
+        cls._class_attrs = frozenset(name for c in cls.__mro__ for name in vars(c))
+
+    @classmethod
+    def _wrap(cls, impl, get_context, _addressof=addressof, _wrappers=_wrappers):
+        """ Return a wrapper of class cls for the existing C object impl.
+            A wrapper for impl that is still alive is reused, it already holds a reference to impl
+            so there's no need to take another one, and otherwise a new wrapper is made.
+            (_addressof and _wrappers are only bound as defaults to make them local lookups)
+        """
+        key = (cls, _addressof(impl))
+        wrapper = _wrappers.get(key)
+        if wrapper is None:
+            wrapper = cls.__new__(cls)
+            Wrapper.__init__(wrapper, impl, get_context)
+            _wrappers[key] = wrapper
+        return wrapper
+
     def __init__(self, impl_or_constructor, get_context=None):
+        # Make attribute lookups safe even if wrapping fails part way through
+        object.__setattr__(self, "_attrs", EMPTY_ATTRS)
         init = False
         if callable(impl_or_constructor):
             # we are constructing a new object
             impl = impl_or_constructor()
             if impl is None:
-                self.__dict__["_impl"] = impl
-                self.__dict__["_attrs"] = EMPTY_ATTRS
-                self.__dict__["_record"] = None
+                object.__setattr__(self, "_impl", impl)
+                object.__setattr__(self, "_addr", 0)
+                object.__setattr__(self, "_record", None)
                 raise ProtonException(
                     "Wrapper failed to create wrapped object. Check for file descriptor or memory exhaustion.")
             init = True
@@ -81,62 +148,56 @@ class Wrapper(object):
 
         if get_context:
             record = get_context(impl)
-            attrs = pn_void2py(pn_record_get(record, PYCTX))
-            if attrs is None:
-                attrs = {}
-                pn_record_def(record, PYCTX, PN_PYREF)
-                pn_record_set(record, PYCTX, pn_py2void(attrs))
+            attrs, created = pn_record_get_or_create_pyctx(record, PYCTX)
+            if created:
                 init = True
         else:
             attrs = EMPTY_ATTRS
             init = False
             record = None
-        self.__dict__["_impl"] = impl
-        self.__dict__["_attrs"] = attrs
-        self.__dict__["_record"] = record
+        object.__setattr__(self, "_impl", impl)
+        object.__setattr__(self, "_addr", addressof(impl))
+        object.__setattr__(self, "_attrs", attrs)
+        object.__setattr__(self, "_record", record)
         if init:
             self._init()
 
     def __getattr__(self, name: str) -> Any:
-        attrs = self.__dict__["_attrs"]
-        if name in attrs:
-            return attrs[name]
-        else:
-            raise AttributeError(name + " not in _attrs")
+        try:
+            return self._attrs[name]
+        except KeyError:
+            raise AttributeError(name + " not in _attrs") from None
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if hasattr(self.__class__, name):
+        if name in type(self)._class_attrs:
             object.__setattr__(self, name, value)
         else:
-            attrs = self.__dict__["_attrs"]
-            attrs[name] = value
+            self._attrs[name] = value
 
     def __delattr__(self, name: str) -> None:
-        attrs = self.__dict__["_attrs"]
+        attrs = self._attrs
         if attrs:
             del attrs[name]
 
     def __hash__(self) -> int:
-        return hash(addressof(self._impl))
+        return self._addr
 
     def __eq__(self, other):
         if isinstance(other, Wrapper):
-            return addressof(self._impl) == addressof(other._impl)
+            return self._addr == other._addr
         return False
 
     def __ne__(self, other: Any) -> bool:
         if isinstance(other, Wrapper):
-            return addressof(self._impl) != addressof(other._impl)
+            return self._addr != other._addr
         return True
 
     def __del__(self) -> None:
         pn_decref(self._impl)
 
     def __repr__(self) -> str:
-        return '<%s.%s 0x%x ~ 0x%x>' % (self.__class__.__module__,
-                                        self.__class__.__name__,
-                                        id(self), addressof(self._impl))
+        return f"{self._repr_prefix}0x{id(self):x} ~ 0x{self._addr:x}>"
 
 
+Wrapper._class_attrs = frozenset(name for c in Wrapper.__mro__ for name in vars(c))
 PYCTX = int(pn_py2void(Wrapper))
-addressof = int
@@ -24,6 +24,7 @@ import gc
 from time import time, sleep
 from proton import *
 from proton.reactor import Container
+from proton._wrapper import _wrappers
 from . import common
 from .common import pump, Skipped
 
@@ -2861,3 +2862,48 @@ class SaslEventTest(CollectorTest):
         assert s.outcome == SASL.OK
         # XXX: the bytes above appear to be correct, but we don't get any
         # sort of event indicating that the transport is authenticated
+
+
+class WrapperTest(Test):
+
+    class CountedConnection(Connection):
+        inits = 0
+
+        def _init(self):
+            WrapperTest.CountedConnection.inits += 1
+            Connection._init(self)
+
+    def test_init_once(self):
+        counted = WrapperTest.CountedConnection
+        counted.inits = 0
+        c = counted()
+        assert counted.inits == 1, counted.inits
+        counted(c._impl)
+        assert counted.inits == 1, counted.inits
+        # an emptied context is still an existing one
+        for name in list(c._attrs):
+            delattr(c, name)
+        counted(c._impl)
+        assert counted.inits == 1, counted.inits
+
+    def test_wrap_reuses_live_wrapper(self):
+        c = Connection()
+        w = Connection.wrap(c._impl)
+        assert Connection.wrap(c._impl) is w
+        key = (Connection, int(c._impl))
+        assert key in _wrappers
+        del w
+        gc.collect()
+        assert key not in _wrappers
+
+    def test_wrap_links(self):
+        c = Connection()
+        ssn = c.session()
+        snd = ssn.sender("sender")
+        rcv = ssn.receiver("receiver")
+        s = Link.wrap(snd._impl)
+        r = Link.wrap(rcv._impl)
+        assert isinstance(s, Sender), s
+        assert isinstance(r, Receiver), r
+        assert Link.wrap(snd._impl) is s
+        assert Link.wrap(rcv._impl) is r
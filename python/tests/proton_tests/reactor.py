@@ -23,7 +23,9 @@ import time
 
 from proton.reactor import Container, ApplicationEvent, EventInjector, Selector, Backoff
 from proton.handlers import Handshaker, MessagingHandler
-from proton import Handler, Url, symbol
+from proton import Event, Handler, Url, symbol
+from proton._handlers import _push_io_events
+from proton._selectable import Selectable
 
 from .common import Test, SkipTest, TestServer, free_tcp_port, free_tcp_ports, ensureCanTestExtendedSASL
 
@@ -352,6 +354,78 @@ class ApplicationEventTest(Test):
         self._wait_for(lambda: self.goodbye_rcvd is not None)
 
 
+class SelectableEventTest(Test):
+    """Test that I/O events raised by a selectable are delivered in order."""
+
+    class Recorder(Handler):
+        def __init__(self):
+            super(SelectableEventTest.Recorder, self).__init__()
+            self.selectable = None
+            self.events = []
+
+        def _record(self, event, name):
+            # The container's own timer selectable reports here too
+            if event.context is self.selectable:
+                self.events.append(name)
+
+        def on_reactor_init(self, event):
+            self.selectable = event.container.selectable(self)
+            self.selectable._transport = None
+            self.selectable.readable()
+            self.selectable.writable()
+
+        def on_selectable_init(self, event):
+            self._record(event, "init")
+
+        def on_selectable_readable(self, event):
+            self._record(event, "readable")
+
+        def on_selectable_writable(self, event):
+            self._record(event, "writable")
+            event.selectable.terminate()
+            event.selectable.update()
+
+        def on_selectable_final(self, event):
+            self._record(event, "final")
+
+        def close(self):
+            pass
+
+    def test_io_events(self):
+        recorder = SelectableEventTest.Recorder()
+        Container(recorder).run()
+        assert recorder.events == ["init", "readable", "writable", "final"], recorder.events
+
+
+class IOEventBatchTest(Test):
+    """Test the batching of the readable and writable events of one I/O wakeup."""
+
+    class Reactor:
+        def __init__(self):
+            self.pushed = []
+
+        def push_event(self, obj, etype):
+            self.pushed.append((obj, etype))
+
+        def push_events(self, events):
+            self.pushed.append(list(events))
+
+    class Custom(Selectable):
+        def readable(self):
+            self._reactor.pushed.append("custom")
+
+    def test_batches(self):
+        r = IOEventBatchTest.Reactor()
+        a = Selectable(None, r)
+        b = Selectable(None, r)
+        c = IOEventBatchTest.Custom(None, r)
+        del r.pushed[:]
+        _push_io_events(r, [a, c, b], [a])
+        assert r.pushed == [[(a, Event.SELECTABLE_READABLE)],
+                            "custom",
+                            [(b, Event.SELECTABLE_READABLE), (a, Event.SELECTABLE_WRITABLE)]], r.pushed
+
+
 class AuthenticationTestHandler(MessagingHandler):
     def __init__(self):
         super(AuthenticationTestHandler, self).__init__()